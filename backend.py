@@ -5,11 +5,20 @@ Core functionality for downloading YouTube videos and audio
 """
 
 import os
+import re
 import sys
 import subprocess
 import json
+import threading
+import time
 from pathlib import Path
 
+# Compiled once at import so each CLI validation skips the re-cache lookup;
+# deliberately loose - it only needs to reject obvious non-YouTube input
+# before a multi-second extraction attempt
+_URL_RE = re.compile(r'^(?:https?://)?(?:www\.|m\.)?(?:youtube\.com/|youtu\.be/)',
+                     re.IGNORECASE)
+
 def check_dependencies():
     """Check if required dependencies are installed"""
     try:
@@ -48,8 +57,16 @@ def check_dependencies():
             print("   pip install yt-dlp")
             return False
 
-def check_ffmpeg():
-    """Check if FFmpeg is available for audio conversion"""
+# Cached result of the FFmpeg probe; the scan over candidate paths spawns
+# subprocesses and only needs to run once per session
+_ffmpeg_available = None
+
+def check_ffmpeg(refresh=False):
+    """Check if FFmpeg is available for audio conversion (cached)"""
+    global _ffmpeg_available
+    if _ffmpeg_available is not None and not refresh:
+        return _ffmpeg_available
+
     # Common FFmpeg locations on Windows
     ffmpeg_paths = [
         'ffmpeg',  # If in PATH
@@ -68,44 +85,65 @@ def check_ffmpeg():
                                   encoding='utf-8', errors='ignore', timeout=10)
             if result.returncode == 0:
                 print(f"✅ FFmpeg found at: {ffmpeg_path}")
+                _ffmpeg_available = True
                 return True
         except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
             continue
-    
+
     print("❌ FFmpeg not found in common locations")
     print("   Please ensure FFmpeg is installed and in your PATH")
+    _ffmpeg_available = False
     return False
 
+# Persistent YoutubeDL instance for metadata extraction.  Building a
+# YoutubeDL re-initializes every extractor, which is expensive; doing it
+# once and reusing the instance makes repeat "Get Info" calls much faster.
+# Downloads still build their own instances because their options (format,
+# progress hooks, output template) change per call.
+_ydl_instance = None
+_ydl_lock = threading.Lock()
+
+def get_ydl_instance():
+    """Return the shared YoutubeDL instance used for metadata extraction"""
+    global _ydl_instance
+    if _ydl_instance is None:
+        with _ydl_lock:
+            if _ydl_instance is None:
+                import yt_dlp
+
+                # Use the most reliable options to avoid 403 errors
+                ydl_opts = {
+                    'quiet': True,
+                    'no_warnings': True,
+                    'extract_flat': False,
+                    # Simple but effective headers
+                    'http_headers': {
+                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                    },
+                    # Remove problematic options that can cause 403 errors
+                    'extractor_retries': 5,
+                    'fragment_retries': 5,
+                    'retries': 5,
+                    # Force IPv4 to avoid some network issues
+                    'source_address': '0.0.0.0',
+                    # Disable cookies to avoid decryption issues
+                    'cookiefile': None,
+                    'cookiesfrombrowser': None,
+                }
+                _ydl_instance = yt_dlp.YoutubeDL(ydl_opts)
+    return _ydl_instance
+
 def get_video_info(url):
     """Get video information from YouTube URL"""
     try:
-        import yt_dlp
-        
-        # Use the most reliable options to avoid 403 errors
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': False,
-            # Simple but effective headers
-            'http_headers': {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            },
-            # Remove problematic options that can cause 403 errors
-            'extractor_retries': 5,
-            'fragment_retries': 5,
-            'retries': 5,
-            # Force IPv4 to avoid some network issues
-            'source_address': '0.0.0.0',
-            # Disable cookies to avoid decryption issues
-            'cookiefile': None,
-            'cookiesfrombrowser': None,
-        }
-        
         print("🔍 Fetching video information...")
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        ydl = get_ydl_instance()
+        # Extraction mutates shared extractor state, so serialize access
+        # to the persistent instance
+        with _ydl_lock:
             info = ydl.extract_info(url, download=False)
-            return info
-                
+        return info
+
     except Exception as e:
         print(f"❌ Error getting video info: {e}")
         # Try one more time with minimal options
@@ -459,59 +497,57 @@ def get_downloadable_video_formats(video_formats, audio_formats):
 
 def display_video_info(info):
     """Display video information"""
-    print("\n" + "="*60)
-    print("📹 VIDEO INFORMATION")
-    print("="*60)
-    
     title = info.get('title', 'Unknown')
     duration = info.get('duration', 0)
     uploader = info.get('uploader', 'Unknown')
     view_count = info.get('view_count', 0)
     upload_date = info.get('upload_date', 'Unknown')
-    
-    print(f"Title: {title}")
-    if duration:
-        print(f"Duration: {duration // 60} minutes")
-    else:
-        print("Duration: Unknown")
-    print(f"Uploader: {uploader}")
-    if view_count:
-        print(f"Views: {view_count:,}")
-    else:
-        print("Views: Unknown")
-    print(f"Upload Date: {upload_date}")
-    print("="*60)
+
+    # Emit the whole block as one write: one stdout lock, one flush
+    lines = [
+        "\n" + "="*60,
+        "📹 VIDEO INFORMATION",
+        "="*60,
+        f"Title: {title}",
+        f"Duration: {duration // 60} minutes" if duration else "Duration: Unknown",
+        f"Uploader: {uploader}",
+        f"Views: {view_count:,}" if view_count else "Views: Unknown",
+        f"Upload Date: {upload_date}",
+        "="*60,
+    ]
+    print('\n'.join(lines))
 
 def display_formats(video_formats, audio_formats):
     """Display available formats"""
-    print("\n🎬 AVAILABLE VIDEO FORMATS:")
-    print("-" * 60)
+    lines = ["\n🎬 AVAILABLE VIDEO FORMATS:", "-" * 60]
     for i, fmt in enumerate(video_formats, 1):
         size_mb = fmt.get('filesize', 0) / (1024 * 1024) if fmt.get('filesize') else 0
         resolution = fmt.get('resolution', 'unknown')
         ext = fmt.get('ext', 'unknown')
         fps = fmt.get('fps', 0)
         has_audio = "✅" if fmt.get('has_audio') else "❌"
-        
-        print(f"{i:2d}. {fmt['format_id']:>8} | {resolution:>12} | "
-              f"{ext:>4} | {fps:>3}fps | {size_mb:>6.1f}MB | Audio: {has_audio}")
-    
-    print("\n🎵 AVAILABLE AUDIO FORMATS:")
-    print("-" * 60)
+
+        lines.append(f"{i:2d}. {fmt['format_id']:>8} | {resolution:>12} | "
+                     f"{ext:>4} | {fps:>3}fps | {size_mb:>6.1f}MB | Audio: {has_audio}")
+
+    lines.append("\n🎵 AVAILABLE AUDIO FORMATS:")
+    lines.append("-" * 60)
     for i, fmt in enumerate(audio_formats, 1):
         size_mb = fmt.get('filesize', 0) / (1024 * 1024) if fmt.get('filesize') else 0
         abr = fmt.get('abr', 0) or 0  # Handle None values
         ext = fmt.get('ext', 'unknown')
-        
-        print(f"{i:2d}. {fmt['format_id']:>8} | {ext:>4} | "
-              f"{abr:>4}kbps | {size_mb:>6.1f}MB")
+
+        lines.append(f"{i:2d}. {fmt['format_id']:>8} | {ext:>4} | "
+                     f"{abr:>4}kbps | {size_mb:>6.1f}MB")
+
+    # One write for the whole table instead of one per row
+    print('\n'.join(lines))
 
 def display_downloadable_formats(video_formats, audio_formats):
     """Display downloadable video formats (with audio combinations)"""
     downloadable_formats = get_downloadable_video_formats(video_formats, audio_formats)
-    
-    print("\n📥 DOWNLOADABLE VIDEO FORMATS:")
-    print("-" * 80)
+
+    lines = ["\n📥 DOWNLOADABLE VIDEO FORMATS:", "-" * 80]
     for i, fmt in enumerate(downloadable_formats, 1):
         size_mb = fmt.get('filesize', 0) / (1024 * 1024) if fmt.get('filesize') else 0
         resolution = fmt.get('resolution', 'unknown')
@@ -519,9 +555,10 @@ def display_downloadable_formats(video_formats, audio_formats):
         fps = fmt.get('fps', 0)
         download_type = fmt.get('download_type', 'unknown')
         description = fmt.get('description', '')
-        
-        print(f"{i:2d}. {fmt['format_id']:>12} | {resolution:>12} | "
-              f"{ext:>4} | {fps:>3}fps | {size_mb:>6.1f}MB | {download_type:>15} | {description}")
+
+        lines.append(f"{i:2d}. {fmt['format_id']:>12} | {resolution:>12} | "
+                     f"{ext:>4} | {fps:>3}fps | {size_mb:>6.1f}MB | {download_type:>15} | {description}")
+    print('\n'.join(lines))
     
     return downloadable_formats
 
@@ -847,17 +884,19 @@ def analyze_quality_details(info, target_quality):
     
     print("=" * 60)
 
-def download_video(url, format_id, output_path="downloads", progress_callback=None):
+def download_video(url, format_id, output_path="downloads", progress_callback=None, info=None):
     """Download video with specified format"""
     try:
         import yt_dlp
-        
+
         # Ensure format_id is a string
         format_id = str(format_id)
-        
-        # Always get fresh video info right before downloading
-        print("🔍 Getting fresh video information...")
-        info = get_video_info(url)
+
+        # Reuse metadata the caller already fetched; only hit the network
+        # again when none was provided
+        if info is None:
+            print("🔍 Getting fresh video information...")
+            info = get_video_info(url)
         if not info:
             print("❌ Failed to get video info for format validation")
             return False
@@ -1021,17 +1060,19 @@ def download_video(url, format_id, output_path="downloads", progress_callback=No
         print(f"   Output path: {output_path}")
         return False
 
-def download_audio(url, format_id, output_path="downloads", progress_callback=None):
+def download_audio(url, format_id, output_path="downloads", progress_callback=None, info=None):
     """Download audio with specified format and convert to MP3"""
     try:
         import yt_dlp
-        
+
         # Ensure format_id is a string
         format_id = str(format_id)
-        
-        # Always get fresh video info right before downloading
-        print("🔍 Getting fresh video information...")
-        info = get_video_info(url)
+
+        # Reuse metadata the caller already fetched; only hit the network
+        # again when none was provided
+        if info is None:
+            print("🔍 Getting fresh video information...")
+            info = get_video_info(url)
         if not info:
             print("❌ Failed to get video info for format validation")
             return False
@@ -1095,17 +1136,19 @@ def download_audio(url, format_id, output_path="downloads", progress_callback=No
         print(f"   Output path: {output_path}")
         return False
 
-def download_audio_raw(url, format_id, output_path="downloads", progress_callback=None):
+def download_audio_raw(url, format_id, output_path="downloads", progress_callback=None, info=None):
     """Download audio with specified format without conversion"""
     try:
         import yt_dlp
-        
+
         # Ensure format_id is a string
         format_id = str(format_id)
-        
-        # Always get fresh video info right before downloading
-        print("🔍 Getting fresh video information...")
-        info = get_video_info(url)
+
+        # Reuse metadata the caller already fetched; only hit the network
+        # again when none was provided
+        if info is None:
+            print("🔍 Getting fresh video information...")
+            info = get_video_info(url)
         if not info:
             print("❌ Failed to get video info for format validation")
             return False
@@ -1200,9 +1243,21 @@ def verify_downloaded_video(file_path):
         print(f"⚠️  Could not verify audio: {e}")
         return True
 
+# Timestamp of the last progress line; yt-dlp calls the hook far more
+# often than a terminal needs repainting
+_last_progress_print = 0.0
+
 def progress_hook(d):
     """Progress hook for download progress"""
+    global _last_progress_print
     if d['status'] == 'downloading':
+        # Limit console repaints to 10Hz; the finished message below is
+        # never throttled
+        now = time.monotonic()
+        if now - _last_progress_print < 0.1:
+            return
+        _last_progress_print = now
+
         total = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
         downloaded = d.get('downloaded_bytes', 0)
         
@@ -1216,30 +1271,47 @@ def progress_hook(d):
     elif d['status'] == 'finished':
         print(f"\n✅ Downloaded: {d['filename']}")
 
+# Menu text built once; printed as a single write per display instead of
+# one syscall per line
+_CLI_MENU = (
+    "\nOptions:\n"
+    "1. Download Video\n"
+    "2. Download Audio\n"
+    "3. Exit"
+)
+_CLI_PROMPT = "\nEnter your choice (1-3): "
+
 def run_cli():
     """Run the CLI version of the downloader"""
-    print("🎬 YouTube Video and Audio Downloader (CLI Mode)")
-    print("=" * 50)
-    
+    print("🎬 YouTube Video and Audio Downloader (CLI Mode)\n" + "=" * 50)
+
     while True:
-        print("\nOptions:")
-        print("1. Download Video")
-        print("2. Download Audio")
-        print("3. Back to Main Menu")
-        
-        choice = input("\nEnter your choice (1-3): ").strip()
-        
+        print(_CLI_MENU)
+        choice = input(_CLI_PROMPT).strip()
+
+        # Re-prompt on bad input without re-printing the whole menu
+        while choice not in ('1', '2', '3'):
+            print("❌ Invalid choice. Please enter 1, 2, or 3.")
+            choice = input(_CLI_PROMPT).strip()
+
         if choice == '3':
-            print("👋 Returning to main menu...")
+            print("👋 Goodbye!")
             break
         
-        elif choice in ['1', '2']:
+        else:
             url = input("\nEnter YouTube URL: ").strip()
             
             if not url:
                 print("❌ Please enter a valid URL")
                 continue
-            
+
+            # Reject obvious non-YouTube input before paying for a doomed
+            # extraction attempt
+            if not _URL_RE.match(url):
+                print("❌ That doesn't look like a YouTube URL "
+                      "(expected youtube.com/... or youtu.be/...)")
+                continue
+
             # Get video info
             print("🔍 Getting video information...")
             info = get_video_info(url)
@@ -1266,7 +1338,9 @@ def run_cli():
                     if 1 <= format_choice <= len(video_formats):
                         selected_format = video_formats[format_choice - 1]
                         output_path = input("Enter output directory (default: downloads): ").strip() or "downloads"
-                        download_video(url, selected_format['format_id'], output_path)
+                        # Reuse the metadata fetched above instead of
+                        # re-running extraction before the download
+                        download_video(url, selected_format['format_id'], output_path, info=info)
                     else:
                         print("❌ Invalid format choice")
                 except ValueError:
@@ -1298,11 +1372,8 @@ def run_cli():
                     if 1 <= format_choice <= len(audio_formats):
                         selected_format = audio_formats[format_choice - 1]
                         output_path = input("Enter output directory (default: downloads): ").strip() or "downloads"
-                        download_audio(url, selected_format['format_id'], output_path)
+                        download_audio(url, selected_format['format_id'], output_path, info=info)
                     else:
                         print("❌ Invalid format choice")
                 except ValueError:
                     print("❌ Please enter a valid number")
-        
-        else:
-            print("❌ Invalid choice. Please enter 1, 2, or 3.") 
\ No newline at end of file
@@ -5,16 +5,228 @@ Modern GUI interface for the YouTube downloader
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
+from tkinter import ttk, filedialog, messagebox
 import threading
+import queue
+import time
 import os
 import subprocess
 import sys
 import re
-import pyperclip  # For clipboard access
-from backend import (get_video_info, get_available_formats, 
-                     get_downloadable_video_formats, download_video, 
-                     download_audio, download_audio_raw)
+import hashlib
+from collections import OrderedDict, defaultdict
+# backend pulls in yt-dlp, whose import alone takes a noticeable fraction
+# of a second; defer loading it so the window paints immediately.  The
+# background probe started from __init__ warms the import, so the first
+# "Get Info" click normally finds it already loaded.
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def _get_backend():
+    """Import backend (and transitively yt-dlp) on first use."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                import backend
+                _backend = backend
+    return _backend
+
+# Compiled once at import; the clipboard poll calls this every cycle and
+# re.match() would pay the re._cache lookup on each call
+_YT_URL_RE = re.compile(
+    r'^(?:https?://)?(?:www\.|m\.)?'
+    r'(?:youtube\.com/(?:watch\?v=|shorts/|embed/)|youtu\.be/)[\w\-]{11}',
+    re.IGNORECASE)
+
+# Cheap prefix gate in front of the regex: the common clipboard content is
+# not a YouTube URL at all, and startswith on a tuple is a few memcmps
+_YT_PREFIXES = ('https://www.youtube.com/', 'http://www.youtube.com/',
+                'https://youtube.com/', 'http://youtube.com/',
+                'https://m.youtube.com/', 'http://m.youtube.com/',
+                'https://youtu.be/', 'http://youtu.be/',
+                'www.youtube.com/', 'm.youtube.com/',
+                'youtube.com/', 'youtu.be/')
+
+# Loose domain-level check for the fetch gate. The strict pattern above
+# suits clipboard auto-paste, where a false negative just means no
+# auto-paste; explicit fetches must admit every URL shape yt-dlp handles
+# (live/ VOD links, music.youtube.com, playlists), so here only obvious
+# non-YouTube input is rejected - same pattern the CLI uses
+_YT_DOMAIN_RE = re.compile(
+    r'^(?:https?://)?(?:[\w\-]+\.)?(?:youtube\.com/|youtu\.be/)',
+    re.IGNORECASE)
+
+# Extracts the 11-char video id so URL variants (tracking params, short
+# links) share one metadata cache entry
+_YT_VIDEO_ID_RE = re.compile(r'(?:v=|youtu\.be/|shorts/|embed/)([\w\-]{11})')
+
+def _normalize_video_url(url):
+    """Canonical cache key for a YouTube URL: the video id when present"""
+    match = _YT_VIDEO_ID_RE.search(url)
+    return match.group(1) if match else url.strip()
+
+def _clipboard_fingerprint(text):
+    """Constant-size fingerprint of clipboard text: (length, 8-byte digest).
+
+    Only the first and last 4 KB feed the digest, so comparing successive
+    polls is constant-time and constant-memory even when the user copies a
+    multi-megabyte document.
+    """
+    if len(text) > 8192:
+        sample = text[:4096] + text[-4096:]
+    else:
+        sample = text
+    digest = hashlib.blake2b(sample.encode('utf-8', 'ignore'), digest_size=8).digest()
+    return (len(text), digest)
+
+def _format_tree_row(fmt):
+    """Build the Treeview value tuple for one format dict.
+
+    Kept as a flat module-level function so the per-row work in long format
+    lists (playlist/channel expansions) stays cheap: one dict-get per field,
+    no attribute lookups, no intermediate objects beyond the row tuple.
+    """
+    get = fmt.get
+    format_id = get('format_id', 'N/A')
+    quality = get('resolution_standard') or get('resolution_precise', 'N/A')
+    resolution = get('resolution_precise', 'N/A')
+    filesize = get('filesize', 0)
+    codec = get('vcodec') or get('acodec', 'N/A')
+    fps = get('fps', 'N/A')
+
+    # Format filesize
+    if filesize:
+        if filesize >= 1024*1024:
+            size_str = f"{filesize/(1024*1024):.1f}MB"
+        elif filesize >= 1024:
+            size_str = f"{filesize/1024:.1f}KB"
+        else:
+            size_str = f"{filesize}B"
+    else:
+        size_str = "N/A"
+
+    # Format FPS
+    if fps and fps != 'N/A':
+        fps_str = f"{fps}fps"
+    else:
+        fps_str = "N/A"
+
+    # Additional details
+    details = []
+    if get('abr'):
+        details.append(f"Audio: {fmt['abr']}kbps")
+    if get('vbr'):
+        details.append(f"Video: {fmt['vbr']}kbps")
+    if get('ext'):
+        details.append(f"Ext: {fmt['ext']}")
+
+    details_str = " | ".join(details) if details else "Standard quality"
+
+    return (format_id, quality, resolution, size_str, codec, fps_str, details_str)
+
+class ClipboardWatcher:
+    """OS clipboard-change notifications instead of timed polling.
+
+    On Windows the Tk root window is registered with
+    AddClipboardFormatListener and its window procedure is subclassed to
+    catch WM_CLIPBOARDUPDATE, so the app only wakes when the clipboard
+    actually changes. On other platforms (or if installing the hook fails)
+    start() returns False and the caller keeps its periodic poll.
+    """
+
+    WM_CLIPBOARDUPDATE = 0x031D
+    GWL_WNDPROC = -4
+
+    def __init__(self, root, callback):
+        self.root = root
+        self.callback = callback
+        self._hwnd = None
+        self._old_wndproc = None
+        self._wndproc_ref = None  # Keep the ctypes callback alive
+        self._user32 = None
+        self._set_wndproc = None
+
+    def start(self):
+        """Install the native listener; returns True if notifications work"""
+        if sys.platform != 'win32':
+            return False
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            user32 = ctypes.windll.user32
+
+            # LRESULT and LONG_PTR are pointer-sized. Without explicit
+            # prototypes ctypes marshals them as 32-bit C ints, which
+            # truncates the saved wndproc address on 64-bit Windows and
+            # crashes on the first forwarded message. wintypes.LPARAM is
+            # the pointer-sized signed type on both word sizes.
+            LRESULT = wintypes.LPARAM
+            LONG_PTR = wintypes.LPARAM
+
+            user32.GetAncestor.restype = wintypes.HWND
+            user32.GetAncestor.argtypes = (wintypes.HWND, wintypes.UINT)
+            user32.AddClipboardFormatListener.restype = wintypes.BOOL
+            user32.AddClipboardFormatListener.argtypes = (wintypes.HWND,)
+            user32.RemoveClipboardFormatListener.restype = wintypes.BOOL
+            user32.RemoveClipboardFormatListener.argtypes = (wintypes.HWND,)
+            user32.CallWindowProcW.restype = LRESULT
+            user32.CallWindowProcW.argtypes = (LONG_PTR, wintypes.HWND,
+                                               wintypes.UINT, wintypes.WPARAM,
+                                               wintypes.LPARAM)
+
+            # SetWindowLongPtrW only exists as an export on 64-bit user32;
+            # on 32-bit Windows the SDK macro maps it to SetWindowLongW
+            set_wndproc = getattr(user32, 'SetWindowLongPtrW',
+                                  user32.SetWindowLongW)
+            set_wndproc.restype = LONG_PTR
+            set_wndproc.argtypes = (wintypes.HWND, ctypes.c_int, LONG_PTR)
+            self._user32 = user32
+            self._set_wndproc = set_wndproc
+
+            # winfo_id() is the inner Tk widget; the top-level owner window
+            # is the one that receives clipboard broadcasts
+            hwnd = user32.GetAncestor(self.root.winfo_id(), 2)  # GA_ROOT
+            if not hwnd or not user32.AddClipboardFormatListener(hwnd):
+                return False
+            self._hwnd = hwnd
+
+            WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND,
+                                         wintypes.UINT, wintypes.WPARAM,
+                                         wintypes.LPARAM)
+
+            def wndproc(hwnd, msg, wparam, lparam):
+                if msg == self.WM_CLIPBOARDUPDATE:
+                    # Hop back onto the Tk event loop - never touch widgets
+                    # from inside a window procedure
+                    self.root.after_idle(self.callback)
+                return user32.CallWindowProcW(self._old_wndproc, hwnd,
+                                              msg, wparam, lparam)
+
+            self._wndproc_ref = WNDPROC(wndproc)
+            self._old_wndproc = set_wndproc(
+                hwnd, self.GWL_WNDPROC,
+                ctypes.cast(self._wndproc_ref, ctypes.c_void_p).value)
+            return bool(self._old_wndproc)
+        except Exception:
+            # Any failure just means we fall back to polling
+            return False
+
+    def stop(self):
+        """Remove the listener and restore the original window procedure"""
+        if self._hwnd is None:
+            return
+        try:
+            # Reuse the function prototypes configured in start()
+            self._user32.RemoveClipboardFormatListener(self._hwnd)
+            if self._old_wndproc:
+                self._set_wndproc(self._hwnd, self.GWL_WNDPROC,
+                                  self._old_wndproc)
+        except Exception:
+            pass
+        self._hwnd = None
 
 class ModernButton(tk.Button):
     """Custom modern button with hover effects"""
@@ -31,17 +243,39 @@ class ModernButton(tk.Button):
         self.configure(bg=self.master.master.colors['button_bg'])
 
 class YouTubeDownloaderGUI:
+    # Placeholder text shown in the empty URL field. Interned so comparisons
+    # against values that carry the same object short-circuit on identity
+    # before any byte compare; == is kept (not `is`) because Entry.get()
+    # returns a fresh str from Tcl and would never be the same object.
+    _PLACEHOLDER = sys.intern("Enter a YouTube URL")
+
+    # Maximum entries in the URL -> metadata LRU cache
+    _INFO_CACHE_MAX = 256
+
+    # The audio view has a single fixed dropdown entry; share one tuple
+    _AUDIO_QUALITY_VALUES = ("All audio formats",)
+
     def __init__(self, root):
         self.root = root
         self.root.title("VideoHub Desktop Suite")
         
         # Initialize variables
         self.downloadable_video_formats = []
+        self.video_formats = []
         self.audio_formats = []
         self.video_info = {}
+        self.video_info_url = None  # URL the stored metadata belongs to
+        self._info_cache = OrderedDict()  # Bounded URL -> metadata LRU cache
+        self._video_by_quality = {}  # Quality label -> formats index
+        self._video_quality_values = None  # Prebuilt dropdown values tuple
+        self._refresh_after_id = None  # Pending debounced tree refresh
         self.quality_var = tk.StringVar()
         self.download_type = tk.StringVar(value="video")
-        self.last_clipboard_content = ""  # Track clipboard changes
+        self.last_clipboard_fingerprint = None  # Track clipboard changes
+        self._last_rendered_id = None  # Identity of the last format list rendered
+        self._last_info_labels = None  # Last values written to the info labels
+        self._poll_interval = 500  # Adaptive clipboard poll backoff (ms)
+        self._poll_after_id = None  # Pending clipboard-poll after() callback
         
         # Color scheme matching VideoHub design
         self.colors = {
@@ -68,6 +302,14 @@ class YouTubeDownloaderGUI:
         
         # Setup UI
         self.setup_ui()
+
+        # Reusable clipboard notification label: created once, shown with
+        # place()/place_forget() instead of per-event widget churn. Colors
+        # are resolved here so showing it never touches the palette dict
+        self._notif = tk.Label(self.root,
+                               bg=self.colors['accent'], fg=self.colors['text'],
+                               font=('Segoe UI', 9), padx=10, pady=5)
+        self._notif_after = None
         
         # Initialize backend
         self.downloader = None  # We'll use functions directly
@@ -75,8 +317,30 @@ class YouTubeDownloaderGUI:
         # Center window
         self.center_window()
         
+        # Set when the window is closing so late worker results are dropped
+        # instead of being scheduled against a destroyed root
+        self._closing = False
+
+        # Probe FFmpeg once in the background; downloads read the cached
+        # flag. Network/probe work runs on daemon threads throughout so a
+        # window close never waits on a retrying yt-dlp call
+        self._ffmpeg_ok = None
+        threading.Thread(target=self._probe_ffmpeg, daemon=True).start()
+
+        # Worker threads post UI updates here; a 50ms pump drains and
+        # coalesces them instead of scheduling one after(0) per callback
+        self._ui_q = queue.Queue()
+        self._pending_details = []  # Detail lines awaiting the 2Hz text flush
+        self._last_details_flush = 0.0
+        self._last_progress_t = 0.0  # Progress-hook throttle timestamp
+        self._pump_interval = 50  # Adaptive pump backoff (ms), like the clipboard poll
+        self._pump_after_id = self.root.after(50, self._pump_ui_queue)
+
         # Start clipboard monitoring
         self._start_clipboard_monitoring()
+
+        # Clean shutdown: cancel pending callbacks and native listeners
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
     
     def center_window(self):
         """Center the window on screen with VideoHub dimensions"""
@@ -195,11 +459,13 @@ class YouTubeDownloaderGUI:
                                  insertbackground=self.colors['text'],
                                  relief=tk.FLAT, bd=0)
         self.url_entry.pack(fill=tk.BOTH, expand=True)
-        self.url_entry.insert(0, "Enter a YouTube URL")
+        self.url_entry.insert(0, self._PLACEHOLDER)
         self.url_entry.bind('<FocusIn>', self._on_url_focus_in)
         self.url_entry.bind('<FocusOut>', self._on_url_focus_out)
         self.url_entry.bind('<Return>', lambda e: self.get_video_info())
-        self.url_entry.bind('<Control-v>', self._manual_paste_from_clipboard)
+        # Let Tk's native <<Paste>> handler do the insertion (one X round
+        # trip), then just validate what landed in the field
+        self.url_entry.bind('<<Paste>>', self._after_paste_validate, add='+')
         
         # Auto-paste from clipboard when URL field gains focus
         self.url_entry.bind('<Button-1>', self._check_clipboard_on_click)
@@ -456,9 +722,11 @@ class YouTubeDownloaderGUI:
         # Initial message
         self.format_tree.insert("", "end", values=("", "", "", "", "", "", "No formats loaded"))
         
-        # Bind quality change
+        # Bind quality change.  The download type relies solely on the
+        # <<ComboboxSelected>> binding set in create_options_section; a
+        # variable trace would also fire on every programmatic write and
+        # trigger spurious rebuilds
         self.quality_combo.bind('<<ComboboxSelected>>', self._on_quality_change)
-        self.download_type.trace('w', self._on_download_type_change)
     
     def setup_treeview_style(self):
         """Setup modern treeview styling"""
@@ -554,10 +822,21 @@ class YouTubeDownloaderGUI:
     def get_video_info(self):
         """Get video information"""
         url = self.url_entry.get().strip()
-        if not url or url == "Enter a YouTube URL":
+        if not url or url == self._PLACEHOLDER:
             messagebox.showerror("Error", "Please enter a valid YouTube URL")
             return
-        
+
+        # Reject obviously malformed input synchronously instead of paying
+        # for a doomed extraction attempt. Deliberately looser than the
+        # clipboard check: anything on a YouTube domain goes to yt-dlp
+        if not _YT_DOMAIN_RE.match(url):
+            messagebox.showerror(
+                "Error",
+                "This doesn't look like a YouTube URL.\n"
+                "Expected something like https://www.youtube.com/watch?v=... "
+                "or https://youtu.be/...")
+            return
+
         # Clear previous data
         self._reset_progress()
         self.progress_display.config(state=tk.NORMAL)
@@ -566,45 +845,96 @@ class YouTubeDownloaderGUI:
         
         # Disable buttons during fetch
         self.fetch_button.config(state=tk.DISABLED)
-        
-        # Start fetch in thread
-        thread = threading.Thread(target=self._get_video_info_thread, args=(url,))
-        thread.daemon = True
-        thread.start()
+
+        # Start fetch in a daemon thread so it can never block app exit
+        threading.Thread(target=self._get_video_info_thread, args=(url,),
+                         daemon=True).start()
     
+    def _cache_get_info(self, url):
+        """Return cached metadata for url, refreshing its LRU position"""
+        key = _normalize_video_url(url)
+        info = self._info_cache.get(key)
+        if info is not None:
+            self._info_cache.move_to_end(key)
+        return info
+
+    def _cache_put_info(self, url, info):
+        """Store metadata in the cache, evicting the oldest entries"""
+        key = _normalize_video_url(url)
+        self._info_cache[key] = info
+        self._info_cache.move_to_end(key)
+        while len(self._info_cache) > self._INFO_CACHE_MAX:
+            self._info_cache.popitem(last=False)
+
+    def _ui_call(self, fn):
+        """Schedule fn on the Tk thread, dropping it if the window closed.
+
+        Worker threads can outlive the window; scheduling against a
+        destroyed root raises, so late results are discarded instead.
+        """
+        if self._closing:
+            return
+        try:
+            self.root.after(0, fn)
+        except (tk.TclError, RuntimeError):
+            pass
+
     def _get_video_info_thread(self, url):
         """Thread for fetching video information"""
         try:
-            # Get video info
-            info = get_video_info(url)
-            if not info:
-                self.root.after(0, lambda: self._show_error("Failed to get video information"))
-                return
-            
+            # Repeat lookups for the same video are answered from the cache
+            # instead of re-running extraction
+            backend = _get_backend()
+            info = self._cache_get_info(url)
+            if info is None:
+                info = backend.get_video_info(url)
+                if not info:
+                    self._ui_call(lambda: self._show_error("Failed to get video information"))
+                    return
+                self._cache_put_info(url, info)
+
             # Get available formats
-            video_formats, audio_formats = get_available_formats(info)
-            downloadable_formats = get_downloadable_video_formats(video_formats, audio_formats)
+            video_formats, audio_formats = backend.get_available_formats(info)
+            downloadable_formats = backend.get_downloadable_video_formats(video_formats, audio_formats)
             if not video_formats and not audio_formats:
-                self.root.after(0, lambda: self._show_error("No formats available for this video"))
+                self._ui_call(lambda: self._show_error("No formats available for this video"))
                 return
-            
+
             # Update GUI on main thread
-            self.root.after(0, lambda: self._update_formats_data(
-                video_formats, audio_formats, downloadable_formats, info))
-            
+            self._ui_call(lambda: self._update_formats_data(
+                video_formats, audio_formats, downloadable_formats, info, url))
+
         except Exception as e:
             error_msg = f"Error: {str(e)}"
-            self.root.after(0, lambda: self._show_error(error_msg))
+            self._ui_call(lambda: self._show_error(error_msg))
         finally:
-            self.root.after(0, lambda: self.fetch_button.config(state=tk.NORMAL))
+            self._ui_call(lambda: self.fetch_button.config(state=tk.NORMAL))
     
-    def _update_formats_data(self, video_formats, audio_formats, downloadable_formats, info):
+    def _update_formats_data(self, video_formats, audio_formats, downloadable_formats, info, url=None):
         """Update all format data and GUI elements"""
         # Store formats
         self.video_formats = video_formats
         self.audio_formats = audio_formats
         self.downloadable_video_formats = downloadable_formats
         self.video_info = info
+        self.video_info_url = url
+
+        # Precompute the display row for every format once per fetch, so
+        # quality/type filter switches never re-run the size/fps formatting,
+        # and index video formats by their quality label so filtering is a
+        # dict lookup instead of a scan
+        self._video_by_quality = defaultdict(list)
+        for fmt in downloadable_formats:
+            fmt['_row'] = _format_tree_row(fmt)
+            quality = fmt.get('resolution_standard') or fmt.get('resolution_precise')
+            if quality:
+                self._video_by_quality[quality].append(fmt)
+        for fmt in audio_formats:
+            fmt['_row'] = _format_tree_row(fmt)
+
+        # Build the dropdown values once per fetch; type switches reuse the
+        # tuple instead of re-collecting and re-sorting the quality labels
+        self._video_quality_values = self._build_quality_values()
         
         # Update video info
         self._update_video_info()
@@ -631,15 +961,16 @@ class YouTubeDownloaderGUI:
             duration = self.video_info.get('duration', 0)
             views = self.video_info.get('view_count', 0)
             channel = self.video_info.get('uploader', 'Unknown')
-            
-            # Format duration
+
+            # Format duration (some extractors report it as a float)
             if duration:
+                duration = int(duration)
                 minutes = duration // 60
                 seconds = duration % 60
                 duration_str = f"{minutes}:{seconds:02d}"
             else:
                 duration_str = "--"
-            
+
             # Format views
             if views:
                 if views >= 1000000:
@@ -650,51 +981,75 @@ class YouTubeDownloaderGUI:
                     views_str = str(views)
             else:
                 views_str = "--"
-            
+
+            # Skip the label writes when re-rendering the same video (cache
+            # hits land here with identical values); each config is a Tcl
+            # round-trip plus a relayout
+            labels = (title, duration_str, views_str, channel)
+            if labels == self._last_info_labels:
+                return
+            self._last_info_labels = labels
+
             self.title_label.config(text=f"Title: {title}")
             self.duration_label.config(text=f"Duration: {duration_str}")
             self.views_label.config(text=f"Views: {views_str}")
             self.channel_label.config(text=f"Channel: {channel}")
     
+    def _build_quality_values(self):
+        """Collect and sort the quality labels for the dropdown, once per fetch"""
+        if not self.downloadable_video_formats:
+            return None
+
+        # Collect unique standard and precise qualities in one pass; precise
+        # labels are only used when no format carries a standard one
+        seen_standard = set()
+        seen_precise = set()
+        standard = []
+        precise = []
+        for fmt in self.downloadable_video_formats:
+            res = fmt.get('resolution_standard')
+            if res and res not in seen_standard:
+                seen_standard.add(res)
+                standard.append(res)
+            res = fmt.get('resolution_precise')
+            if res and res not in seen_precise:
+                seen_precise.add(res)
+                precise.append(res)
+
+        qualities = standard or precise
+        if not qualities:
+            return None
+
+        # Sort qualities logically
+        def sort_resolution(res):
+            try:
+                if res.endswith('p'):
+                    return int(res[:-1])
+                if 'x' in res:
+                    # Precise "WxH" labels sort by height
+                    return int(res.partition('x')[2] or 0)
+                if res.upper().endswith('K'):
+                    # "4K"/"8K" style labels
+                    return int(res[:-1]) * 1080
+            except ValueError:
+                pass
+            return 0
+
+        return tuple(sorted(qualities, key=sort_resolution, reverse=True))
+
     def _update_quality_dropdown(self):
-        """Update quality dropdown with available qualities"""
-        if not hasattr(self, 'downloadable_video_formats') or not self.downloadable_video_formats:
-            self.quality_combo['values'] = ["No formats available"]
+        """Update quality dropdown from the values prebuilt at fetch time"""
+        if not self.downloadable_video_formats:
+            self.quality_combo['values'] = ("No formats available",)
             self.quality_combo.set("No formats available")
             return
-        
-        # Get unique qualities
-        qualities = set()
-        for fmt in self.downloadable_video_formats:
-            if fmt.get('resolution_standard') and fmt['resolution_standard']:
-                qualities.add(fmt['resolution_standard'])
-        
-        if not qualities:
-            qualities = set()
-            for fmt in self.downloadable_video_formats:
-                if fmt.get('resolution_precise') and fmt['resolution_precise']:
-                    qualities.add(fmt['resolution_precise'])
-        
-        if qualities:
-            # Sort qualities logically
-            def sort_resolution(res):
-                if 'p' in res:
-                    try:
-                        return int(res.replace('p', ''))
-                    except:
-                        return 0
-                elif 'k' in res:
-                    try:
-                        return int(res.replace('k', ''))
-                    except:
-                        return 0
-                return 0
-            
-            sorted_qualities = sorted(qualities, key=sort_resolution, reverse=True)
-            self.quality_combo['values'] = sorted_qualities
-            self.quality_combo.set(sorted_qualities[0])
+
+        values = self._video_quality_values
+        if values:
+            self.quality_combo['values'] = values
+            self.quality_combo.set(values[0])
         else:
-            self.quality_combo['values'] = ["No quality info"]
+            self.quality_combo['values'] = ("No quality info",)
             self.quality_combo.set("No quality info")
     
     def _filter_formats_by_quality(self):
@@ -705,36 +1060,47 @@ class YouTubeDownloaderGUI:
         selected_quality = self.quality_var.get()
         if not selected_quality or selected_quality in ["Select quality after fetching", "No formats available", "No quality info"]:
             return self.downloadable_video_formats
-        
-        filtered_formats = []
-        for fmt in self.downloadable_video_formats:
-            if self._quality_matches(selected_quality, fmt):
-                filtered_formats.append(fmt)
-        
-        return filtered_formats
-    
-    def _quality_matches(self, selected_quality, format_obj):
-        """Check if format quality matches selected quality"""
-        if format_obj.get('resolution_standard') and format_obj['resolution_standard']:
-            return format_obj['resolution_standard'] == selected_quality
-        elif format_obj.get('resolution_precise') and format_obj['resolution_precise']:
-            return format_obj['resolution_precise'] == selected_quality
-        return False
+
+        # One dict lookup on the index built at fetch time; returns the same
+        # list object per quality, so identical selections skip re-rendering
+        return self._video_by_quality.get(selected_quality, [])
     
+    def _schedule_refresh(self, callback):
+        """Coalesce rapid combobox/type events into one tree rebuild"""
+        if self._refresh_after_id:
+            self.root.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.root.after(80, self._run_refresh, callback)
+
+    def _run_refresh(self, callback):
+        """Run the debounced refresh scheduled by _schedule_refresh"""
+        self._refresh_after_id = None
+        callback()
+
     def _on_quality_change(self, *args):
         """Handle quality filter change"""
+        self._schedule_refresh(self._apply_quality_change)
+
+    def _apply_quality_change(self):
+        """Apply the selected quality filter to the format tree"""
         # Only filter if we have formats loaded
-        if (self.download_type.get() == "video" and 
+        if (self.download_type.get() == "video" and
             hasattr(self, 'downloadable_video_formats') and self.downloadable_video_formats):
             filtered_formats = self._filter_formats_by_quality()
             self._update_format_tree(filtered_formats)
-        elif (self.download_type.get() == "audio" and 
+        elif (self.download_type.get() == "audio" and
               hasattr(self, 'audio_formats') and self.audio_formats):
             # For audio, show all audio formats
             self._update_format_tree(self.audio_formats)
-    
+
     def _on_download_type_change(self, *args):
         """Handle download type change"""
+        # Nothing to rebuild before the first fetch completes
+        if not self.video_formats and not self.audio_formats:
+            return
+        self._schedule_refresh(self._apply_download_type_change)
+
+    def _apply_download_type_change(self):
+        """Repopulate the tree and dropdown for the selected download type"""
         # Only update if we have formats loaded
         if hasattr(self, 'downloadable_video_formats') and self.downloadable_video_formats:
             if self.download_type.get() == "video":
@@ -743,62 +1109,53 @@ class YouTubeDownloaderGUI:
             else:
                 if hasattr(self, 'audio_formats') and self.audio_formats:
                     self._update_format_tree(self.audio_formats)
-                    self.quality_combo['values'] = ["All audio formats"]
-                    self.quality_combo.set("All audio formats")
+                    self.quality_combo['values'] = self._AUDIO_QUALITY_VALUES
+                    self.quality_combo.set(self._AUDIO_QUALITY_VALUES[0])
     
     def _update_format_tree(self, formats):
         """Update format tree with flexible display"""
-        # Clear existing items
-        for item in self.format_tree.get_children():
-            self.format_tree.delete(item)
-        
+        # No-op filter changes hand back the exact list already on screen;
+        # skip the Tk work entirely in that case
+        if formats and id(formats) == self._last_rendered_id:
+            return
+
+        existing_items = self.format_tree.get_children()
+
         if not formats:
+            self._last_rendered_id = None
+            if existing_items:
+                self.format_tree.delete(*existing_items)
             self.format_tree.insert("", "end", values=("", "", "", "", "", "", "No formats available"))
             return
-        
-        # Add formats with alternating row colors
-        for i, fmt in enumerate(formats):
-            # Get format details
-            format_id = fmt.get('format_id', 'N/A')
-            quality = fmt.get('resolution_standard', fmt.get('resolution_precise', 'N/A'))
-            resolution = fmt.get('resolution_precise', 'N/A')
-            filesize = fmt.get('filesize', 0)
-            codec = fmt.get('vcodec', fmt.get('acodec', 'N/A'))
-            fps = fmt.get('fps', 'N/A')
-            
-            # Format filesize
-            if filesize:
-                if filesize >= 1024*1024:
-                    size_str = f"{filesize/(1024*1024):.1f}MB"
-                elif filesize >= 1024:
-                    size_str = f"{filesize/1024:.1f}KB"
-                else:
-                    size_str = f"{filesize}B"
-            else:
-                size_str = "N/A"
-            
-            # Format FPS
-            if fps and fps != 'N/A':
-                fps_str = f"{fps}fps"
-            else:
-                fps_str = "N/A"
-            
-            # Get additional details
-            details = []
-            if fmt.get('abr'):
-                details.append(f"Audio: {fmt['abr']}kbps")
-            if fmt.get('vbr'):
-                details.append(f"Video: {fmt['vbr']}kbps")
-            if fmt.get('ext'):
-                details.append(f"Ext: {fmt['ext']}")
-            
-            details_str = " | ".join(details) if details else "Standard quality"
-            
-            # Insert with alternating colors
-            tag = 'even' if i % 2 == 0 else 'odd'
-            self.format_tree.insert("", "end", values=(
-                format_id, quality, resolution, size_str, codec, fps_str, details_str
-            ), tags=(tag,))
+
+        self._last_rendered_id = id(formats)
+
+        # Build all rows first so the tree is only touched once per update,
+        # alternating row colors as before; rows are precomputed at fetch
+        # time and only built here for formats that lack one
+        rows = [(fmt.get('_row') or _format_tree_row(fmt),
+                 'even' if i % 2 == 0 else 'odd')
+                for i, fmt in enumerate(formats)]
+
+        # Suspend redraws while mutating the tree (every insert schedules a
+        # layout pass otherwise), then restore the columns in one go
+        self.format_tree.configure(displaycolumns=())
+        try:
+            # Local binds keep the per-row cost to the Tcl call itself
+            tree_item = self.format_tree.item
+            tree_insert = self.format_tree.insert
+
+            # Reuse surviving rows instead of delete-all-then-insert-all
+            for item, (values, tag) in zip(existing_items, rows):
+                tree_item(item, values=values, tags=(tag,))
+            for values, tag in rows[len(existing_items):]:
+                tree_insert("", "end", values=values, tags=(tag,))
+            stale = existing_items[len(rows):]
+            if stale:
+                # One interpreter crossing for all stale rows
+                self.format_tree.delete(*stale)
+        finally:
+            self.format_tree.configure(displaycolumns='#all')
     
     def _get_resolution_height(self, resolution):
         """Extract height from resolution string"""
@@ -829,7 +1186,7 @@ class YouTubeDownloaderGUI:
     def start_download(self):
         """Start the download process"""
         url = self.url_entry.get().strip()
-        if not url or url == "Enter a YouTube URL":
+        if not url or url == self._PLACEHOLDER:
             messagebox.showerror("Error", "Please enter a valid YouTube URL")
             return
         
@@ -851,6 +1208,15 @@ class YouTubeDownloaderGUI:
         if not output_path:
             messagebox.showerror("Error", "Please select an output directory")
             return
+
+        # Audio downloads need FFmpeg for MP3 conversion; fail fast on the
+        # cached probe result instead of erroring mid-download
+        if self.download_type.get() == "audio" and self._ffmpeg_ok is False:
+            messagebox.showerror("Error",
+                                 "FFmpeg was not found. Audio downloads require FFmpeg "
+                                 "for MP3 conversion - run install_ffmpeg.bat or add "
+                                 "FFmpeg to your PATH, then restart the app.")
+            return
         
         # Clear progress and start download
         self._reset_progress()
@@ -870,22 +1236,51 @@ class YouTubeDownloaderGUI:
         thread.daemon = True
         thread.start()
     
+    def _probe_ffmpeg(self):
+        """Background environment probe; results are cached for the session.
+
+        Runs off the startup critical path: the window is already on
+        screen while this verifies yt-dlp (installing it if missing),
+        probes FFmpeg and warms the shared YoutubeDL instance so the
+        first Get Info click skips extractor initialization.
+        """
+        backend = _get_backend()
+        backend.check_dependencies()
+        self._ffmpeg_ok = backend.check_ffmpeg()
+        backend.get_ydl_instance()
+
     def _download_thread(self, url, format_id, output_path):
         """Thread for downloading video"""
         try:
+            # Reuse the metadata fetched for this URL so the backend does
+            # not repeat the multi-second extraction before downloading
+            info = self.video_info if url == self.video_info_url else None
+
+            backend = _get_backend()
             if self.download_type.get() == "audio":
-                download_audio(url, format_id, output_path, self._progress_callback)
+                backend.download_audio(url, format_id, output_path, self._progress_callback, info=info)
             else:
-                download_video(url, format_id, output_path, self._progress_callback)
-            
-            self.root.after(0, self._download_complete)
+                backend.download_video(url, format_id, output_path, self._progress_callback, info=info)
             
+            self._ui_q.put(('done', None))
+
         except Exception as e:
-            error_msg = f"Download error: {str(e)}"
-            self.root.after(0, lambda: self._show_error(error_msg))
-        finally:
-            self.root.after(0, self._enable_buttons)
-    
+            self._ui_q.put(('error', f"Download error: {str(e)}"))
+
+    def _finish_download(self, error_msg=None):
+        """Apply the whole end-of-download UI transition in one callback.
+
+        Scheduling the completion message and the button re-enable as
+        separate after(0) callbacks meant two Tcl command objects and two
+        event dispatches per download; doing both here halves that and
+        keeps the transition atomic from the user's point of view.
+        """
+        if error_msg is None:
+            self._download_complete()
+        else:
+            self._show_error(error_msg)
+        self._enable_buttons()
+
     def _show_format_error(self, url, format_id):
         """Show format-specific error with retry option"""
         error_msg = f"Error downloading format {format_id}.\n\n"
@@ -904,44 +1299,80 @@ class YouTubeDownloaderGUI:
         if result:
             self._refresh_formats()
     
+    def _notify(self, title, message, kind='info'):
+        """Show a non-modal notification window that auto-dismisses.
+
+        messagebox popups spin a nested modal event loop, which stalls
+        after() callbacks (the UI pump, clipboard poll) and any progress
+        still arriving from background threads until the user clicks OK.
+        A plain transient Toplevel keeps the mainloop running; no
+        grab_set/wait_window on purpose.
+        """
+        top = tk.Toplevel(self.root)
+        top.title(title)
+        top.transient(self.root)
+        top.resizable(False, False)
+        top.configure(bg=self.colors['card_bg'])
+
+        accent = self.colors['error'] if kind == 'error' else self.colors['accent']
+        tk.Frame(top, bg=accent, height=4).pack(fill=tk.X)
+        tk.Label(top, text=message, bg=self.colors['card_bg'],
+                 fg=self.colors['text'], font=('Segoe UI', 10),
+                 wraplength=360, justify=tk.LEFT,
+                 padx=20, pady=15).pack()
+        tk.Button(top, text="OK", command=top.destroy,
+                  bg=self.colors['button_bg'], fg=self.colors['button_fg'],
+                  relief=tk.FLAT, padx=20, cursor='hand2').pack(pady=(0, 12))
+
+        # Position near the center of the main window
+        top.update_idletasks()
+        x = self.root.winfo_x() + (self.root.winfo_width() - top.winfo_width()) // 2
+        y = self.root.winfo_y() + (self.root.winfo_height() - top.winfo_height()) // 3
+        top.geometry(f"+{x}+{y}")
+
+        # Auto-dismiss; guard in case the user already clicked OK
+        top.after(4000, lambda: top.winfo_exists() and top.destroy())
+
     def _download_complete(self):
         """Handle download completion"""
         self.progress_display.config(state=tk.NORMAL)
         self.progress_display.insert(tk.END, "✅ Download completed successfully!\n")
         self.progress_display.config(state=tk.DISABLED)
         self.progress_display.see(tk.END)
-        
+
         # Reset progress bar
         self.progress_bar['value'] = 0
-        
+
         # Show completion message
-        messagebox.showinfo("Download Complete", "Video downloaded successfully!")
-    
+        self._notify("Download Complete", "Video downloaded successfully!")
+
     def _show_error(self, error_msg):
         """Show error message"""
         self.progress_display.config(state=tk.NORMAL)
         self.progress_display.insert(tk.END, f"❌ {error_msg}\n")
         self.progress_display.config(state=tk.DISABLED)
         self.progress_display.see(tk.END)
-        
+
         # Reset progress bar
         self.progress_bar['value'] = 0
-        
-        # Show error message box
-        messagebox.showerror("Error", error_msg)
+
+        # Show error notification
+        self._notify("Error", error_msg, kind='error')
     
     def _enable_buttons(self):
         """Enable all buttons"""
-        self.download_button.config(state=tk.NORMAL)
-        self.refresh_button.config(state=tk.NORMAL)
-        self.analyze_button.config(state=tk.NORMAL)
-    
+        # __setitem__ sets the one option directly; configure() goes
+        # through full option parsing on the Tcl side
+        self.download_button['state'] = tk.NORMAL
+        self.refresh_button['state'] = tk.NORMAL
+        self.analyze_button['state'] = tk.NORMAL
+
     def _disable_buttons(self):
         """Disable all buttons during download"""
-        self.download_button.config(state=tk.DISABLED)
-        self.refresh_button.config(state=tk.DISABLED)
-        self.analyze_button.config(state=tk.DISABLED)
-        self.fetch_button.config(state=tk.DISABLED)
+        self.download_button['state'] = tk.DISABLED
+        self.refresh_button['state'] = tk.DISABLED
+        self.analyze_button['state'] = tk.DISABLED
+        self.fetch_button['state'] = tk.DISABLED
     
     def _update_progress(self, message):
         """Update progress display"""
@@ -953,27 +1384,93 @@ class YouTubeDownloaderGUI:
     def _progress_callback(self, d):
         """Progress callback for yt-dlp"""
         if d['status'] == 'downloading':
+            # yt-dlp can fire this hundreds of times per second; 10Hz is
+            # plenty for a progress bar and skips the f-string formatting
+            # and queue traffic for the rest. Terminal events bypass the
+            # throttle below so completion is never dropped.
+            now = time.monotonic()
+            if now - self._last_progress_t < 0.1:
+                return
+            self._last_progress_t = now
+
             # Update progress bar
             if 'total_bytes' in d and d['total_bytes']:
                 percentage = (d['downloaded_bytes'] / d['total_bytes']) * 100
-                self.root.after(0, lambda: self._update_progress_bar(percentage))
-            
+                self._ui_q.put(('progress', percentage))
+
             # Update progress details
             details = f"[{d.get('_percent_str', '0%')}] "
             details += f"Downloading... "
-            
+
             if 'speed' in d and d['speed']:
                 speed_mb = d['speed'] / (1024 * 1024)
                 details += f"Speed: {speed_mb:.1f} MB/s "
-            
+
             if 'eta' in d and d['eta']:
                 details += f"ETA: {d['eta']}s"
-            
-            self.root.after(0, lambda: self._update_progress_details(details))
-            
+
+            self._ui_q.put(('details', details))
+
         elif d['status'] == 'finished':
-            self.root.after(0, lambda: self._show_processing_status("Processing downloaded file..."))
-    
+            self._ui_q.put(('status', "Processing downloaded file..."))
+
+    def _pump_ui_queue(self):
+        """Drain worker-thread UI updates once per 50ms mainloop tick.
+
+        yt-dlp fires its hook far faster than the screen needs; draining
+        everything queued since the last tick and keeping only the latest
+        progress value means one progress-bar write and one Text insert
+        per tick instead of one scheduled callback per hook.
+        """
+        percentage = None
+        details = []
+        status = None
+        finished = False
+        error = None
+        while True:
+            try:
+                kind, payload = self._ui_q.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                percentage = payload
+            elif kind == 'details':
+                details.append(payload)
+            elif kind == 'status':
+                status = payload
+            elif kind == 'done':
+                finished = True
+            elif kind == 'error':
+                finished = True
+                error = payload
+        # The bar redraw is cheap (one rectangle), so it tracks every tick;
+        # Text inserts relayout and scroll the terminal display, so detail
+        # lines are batched and flushed at roughly 2Hz
+        if percentage is not None:
+            self._update_progress_bar(percentage)
+        if details:
+            self._pending_details.extend(details)
+        now = time.monotonic()
+        if self._pending_details and (status is not None or finished
+                                      or now - self._last_details_flush >= 0.5):
+            self._update_progress_details('\n'.join(self._pending_details))
+            self._pending_details.clear()
+            self._last_details_flush = now
+        if status is not None:
+            self._show_processing_status(status)
+        if finished:
+            self._finish_download(error)
+
+        # Adapt the tick to the traffic: stay at 50ms while messages are
+        # flowing, back off towards 400ms when idle so an inactive window
+        # wakes up an order of magnitude less often
+        if percentage is not None or details or status is not None or finished:
+            self._pump_interval = 50
+        else:
+            self._pump_interval = min(self._pump_interval * 2, 400)
+        self._pump_after_id = self.root.after(self._pump_interval,
+                                              self._pump_ui_queue)
+
     def _update_progress_bar(self, percentage):
         """Update progress bar value"""
         self.progress_bar['value'] = percentage
@@ -981,13 +1478,15 @@ class YouTubeDownloaderGUI:
     def _update_progress_details(self, details):
         """Update progress details in terminal display"""
         self.progress_display.config(state=tk.NORMAL)
-        self.progress_display.insert(tk.END, f"{details}\n")
-        
-        # Keep only last 50 lines for performance
-        lines = self.progress_display.get('1.0', tk.END).split('\n')
-        if len(lines) > 50:
-            self.progress_display.delete('1.0', f"{len(lines)-50}.0")
-        
+        self.progress_display.insert(tk.END, details + '\n')
+
+        # Keep only last 50 lines for performance.  Asking Tk for the index
+        # of the last character costs a few bytes over the Tcl bridge,
+        # instead of round-tripping the entire buffer just to count lines
+        line_count = int(self.progress_display.index('end-1c').split('.')[0])
+        if line_count > 50:
+            self.progress_display.delete('1.0', f"{line_count - 50}.0")
+
         self.progress_display.config(state=tk.DISABLED)
         self.progress_display.see(tk.END)
     
@@ -1000,6 +1499,9 @@ class YouTubeDownloaderGUI:
     
     def _reset_progress(self):
         """Reset progress display and bar"""
+        # A fetch or download is about to start; snap the pump back to its
+        # fast tick so the first updates are not delayed by idle backoff
+        self._pump_interval = 50
         self.progress_bar['value'] = 0
         self.progress_display.config(state=tk.NORMAL)
         self.progress_display.delete('1.0', tk.END)
@@ -1008,7 +1510,7 @@ class YouTubeDownloaderGUI:
     def _refresh_formats(self):
         """Refresh available formats"""
         url = self.url_entry.get().strip()
-        if not url or url == "Enter a YouTube URL":
+        if not url or url == self._PLACEHOLDER:
             messagebox.showerror("Error", "Please enter a valid YouTube URL first")
             return
         
@@ -1020,34 +1522,36 @@ class YouTubeDownloaderGUI:
         
         # Disable buttons during refresh
         self.refresh_button.config(state=tk.DISABLED)
-        
-        # Start refresh in thread
-        thread = threading.Thread(target=self._refresh_formats_thread, args=(url,))
-        thread.daemon = True
-        thread.start()
+
+        # Start refresh in a daemon thread so it can never block app exit
+        threading.Thread(target=self._refresh_formats_thread, args=(url,),
+                         daemon=True).start()
     
     def _refresh_formats_thread(self, url):
         """Thread for refreshing formats"""
         try:
-            # Get fresh video info first
-            info = get_video_info(url)
+            # Get fresh video info first (refresh deliberately bypasses the
+            # cache, but the fresh result replaces the cached entry)
+            backend = _get_backend()
+            info = backend.get_video_info(url)
             if not info:
-                self.root.after(0, lambda: self._show_error("Failed to refresh video information"))
+                self._ui_call(lambda: self._show_error("Failed to refresh video information"))
                 return
-            
+            self._cache_put_info(url, info)
+
             # Get fresh formats
-            video_formats, audio_formats = get_available_formats(info)
-            downloadable_formats = get_downloadable_video_formats(video_formats, audio_formats)
-            
+            video_formats, audio_formats = backend.get_available_formats(info)
+            downloadable_formats = backend.get_downloadable_video_formats(video_formats, audio_formats)
+
             # Update GUI on main thread
-            self.root.after(0, lambda: self._update_formats_data(
-                video_formats, audio_formats, downloadable_formats, info))
-            
+            self._ui_call(lambda: self._update_formats_data(
+                video_formats, audio_formats, downloadable_formats, info, url))
+
         except Exception as e:
             error_msg = f"Refresh error: {str(e)}"
-            self.root.after(0, lambda: self._show_error(error_msg))
+            self._ui_call(lambda: self._show_error(error_msg))
         finally:
-            self.root.after(0, lambda: self.refresh_button.config(state=tk.NORMAL))
+            self._ui_call(lambda: self.refresh_button.config(state=tk.NORMAL))
     
     def _show_debug_formats(self):
         """Show debug information for formats"""
@@ -1077,7 +1581,9 @@ class YouTubeDownloaderGUI:
                             bg=self.colors['bg'], fg=self.colors['text'])
         raw_label.pack(anchor=tk.W, pady=(0, 10))
         
-        # Raw text area
+        # Raw text area (scrolledtext is only needed for this window and
+        # the analysis one, so it is imported on first use)
+        from tkinter import scrolledtext
         raw_text = scrolledtext.ScrolledText(debug_frame, height=15, width=80,
                                             bg=self.colors['entry_bg'], fg=self.colors['text'],
                                             font=('Consolas', 9))
@@ -1134,7 +1640,7 @@ class YouTubeDownloaderGUI:
             self.root.clipboard_clear()
             self.root.clipboard_append(raw_text)
             messagebox.showinfo("Copied", "Debug information copied to clipboard!")
-        except Exception as e:
+        except tk.TclError as e:
             messagebox.showerror("Error", f"Failed to copy to clipboard: {str(e)}")
     
     def _show_ffmpeg_warning(self, url, format_id, output_path):
@@ -1157,21 +1663,18 @@ class YouTubeDownloaderGUI:
     def _download_raw_audio(self, url, format_id, output_path):
         """Download raw audio format"""
         try:
-            download_audio_raw(url, format_id, output_path, self._progress_callback)
-            self.root.after(0, self._download_complete)
+            info = self.video_info if url == self.video_info_url else None
+            _get_backend().download_audio_raw(url, format_id, output_path, self._progress_callback, info=info)
+            self._ui_q.put(('done', None))
         except Exception as e:
-            error_msg = f"Audio download error: {str(e)}"
-            self.root.after(0, lambda: self._show_error(error_msg))
-    
+            self._ui_q.put(('error', f"Audio download error: {str(e)}"))
+
     def _raw_audio_download_thread(self, url, format_id, output_path):
         """Thread for raw audio download"""
         try:
             self._download_raw_audio(url, format_id, output_path)
         except Exception as e:
-            error_msg = f"Audio download error: {str(e)}"
-            self.root.after(0, lambda: self._show_error(error_msg))
-        finally:
-            self.root.after(0, self._enable_buttons)
+            self._ui_q.put(('error', f"Audio download error: {str(e)}"))
     
     def analyze_quality(self):
         """Analyze video quality and provide recommendations"""
@@ -1196,16 +1699,18 @@ class YouTubeDownloaderGUI:
         title_label.pack(pady=(0, 20))
         
         # Analysis text
+        from tkinter import scrolledtext
         analysis_text = scrolledtext.ScrolledText(analysis_frame, height=20, width=70,
                                                 bg=self.colors['entry_bg'], fg=self.colors['text'],
                                                 font=('Segoe UI', 10))
         analysis_text.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
         
-        # Perform analysis
+        # Perform analysis, streaming each section into the text widget so
+        # long reports appear incrementally instead of in one big insert
         def analyze_thread():
             try:
-                analysis = self._perform_quality_analysis()
-                analysis_window.after(0, lambda: analysis_text.insert(tk.END, analysis))
+                for chunk in self._perform_quality_analysis():
+                    analysis_window.after(0, lambda c=chunk: analysis_text.insert(tk.END, c))
                 analysis_window.after(0, lambda: analysis_text.config(state=tk.DISABLED))
             except Exception as e:
                 error_msg = f"Analysis error: {str(e)}"
@@ -1227,15 +1732,15 @@ class YouTubeDownloaderGUI:
         close_button.pack()
     
     def _perform_quality_analysis(self):
-        """Perform quality analysis and return recommendations"""
-        analysis = "📊 Quality Analysis Report\n"
-        analysis += "=" * 40 + "\n\n"
-        
+        """Yield quality analysis sections, built without quadratic string concat"""
+        yield "📊 Quality Analysis Report\n" + "=" * 40 + "\n\n"
+
         if not hasattr(self, 'downloadable_video_formats'):
-            return "No formats available for analysis."
-        
+            yield "No formats available for analysis."
+            return
+
         formats = self.downloadable_video_formats
-        
+
         # Resolution analysis
         resolutions = {}
         for fmt in formats:
@@ -1243,58 +1748,58 @@ class YouTubeDownloaderGUI:
             if res not in resolutions:
                 resolutions[res] = 0
             resolutions[res] += 1
-        
-        analysis += "📺 Resolution Distribution:\n"
+
+        parts = ["📺 Resolution Distribution:\n"]
         for res, count in sorted(resolutions.items(), key=lambda x: self._get_resolution_height(x[0]), reverse=True):
-            analysis += f"  {res}: {count} format(s)\n"
-        
+            parts.append(f"  {res}: {count} format(s)\n")
+        yield ''.join(parts)
+
         # Quality recommendations
-        analysis += "\n💡 Quality Recommendations:\n"
-        
+        parts = ["\n💡 Quality Recommendations:\n"]
+
         # Find best quality options
-        high_quality = [f for f in formats if f.get('resolution_standard') and 
+        high_quality = [f for f in formats if f.get('resolution_standard') and
                        '1080' in str(f['resolution_standard']) or '1440' in str(f['resolution_standard'])]
-        medium_quality = [f for f in formats if f.get('resolution_standard') and 
+        medium_quality = [f for f in formats if f.get('resolution_standard') and
                          '720' in str(f['resolution_standard'])]
-        low_quality = [f for f in formats if f.get('resolution_standard') and 
+        low_quality = [f for f in formats if f.get('resolution_standard') and
                        '480' in str(f['resolution_standard']) or '360' in str(f['resolution_standard'])]
-        
+
         if high_quality:
-            analysis += "  🎯 High Quality (1080p+): Available\n"
+            parts.append("  🎯 High Quality (1080p+): Available\n")
             best_high = max(high_quality, key=lambda x: x.get('filesize', 0))
-            analysis += f"    Recommended: {best_high.get('resolution_standard', 'N/A')} "
-            analysis += f"(ID: {best_high.get('format_id', 'N/A')})\n"
-        
+            parts.append(f"    Recommended: {best_high.get('resolution_standard', 'N/A')} ")
+            parts.append(f"(ID: {best_high.get('format_id', 'N/A')})\n")
+
         if medium_quality:
-            analysis += "  📱 Medium Quality (720p): Available\n"
+            parts.append("  📱 Medium Quality (720p): Available\n")
             best_medium = max(medium_quality, key=lambda x: x.get('filesize', 0))
-            analysis += f"    Recommended: {best_medium.get('resolution_standard', 'N/A')} "
-            analysis += f"(ID: {best_medium.get('format_id', 'N/A')})\n"
-        
+            parts.append(f"    Recommended: {best_medium.get('resolution_standard', 'N/A')} ")
+            parts.append(f"(ID: {best_medium.get('format_id', 'N/A')})\n")
+
         if low_quality:
-            analysis += "  ⚡ Low Quality (480p/360p): Available\n"
+            parts.append("  ⚡ Low Quality (480p/360p): Available\n")
             best_low = max(low_quality, key=lambda x: x.get('filesize', 0))
-            analysis += f"    Recommended: {best_low.get('resolution_standard', 'N/A')} "
-            analysis += f"(ID: {best_low.get('format_id', 'N/A')})\n"
-        
+            parts.append(f"    Recommended: {best_low.get('resolution_standard', 'N/A')} ")
+            parts.append(f"(ID: {best_low.get('format_id', 'N/A')})\n")
+        yield ''.join(parts)
+
         # Audio analysis
         audio_formats = [f for f in formats if f.get('audio_format_id') and f['audio_format_id']]
         if audio_formats:
-            analysis += "\n🎵 Audio Quality:\n"
             best_audio = max(audio_formats, key=lambda x: x.get('abr', 0))
-            analysis += f"  Best audio bitrate: {best_audio.get('abr', 'N/A')}kbps\n"
-        
-        analysis += "\n🔍 Tips:\n"
-        analysis += "  • Higher resolution = Better quality but larger file size\n"
-        analysis += "  • Combined formats (video+audio) provide best quality\n"
-        analysis += "  • Audio-only formats are smaller and faster to download\n"
-        analysis += "  • Use 'Analyze' button for detailed format information\n"
-        
-        return analysis
+            yield ("\n🎵 Audio Quality:\n"
+                   f"  Best audio bitrate: {best_audio.get('abr', 'N/A')}kbps\n")
+
+        yield ("\n🔍 Tips:\n"
+               "  • Higher resolution = Better quality but larger file size\n"
+               "  • Combined formats (video+audio) provide best quality\n"
+               "  • Audio-only formats are smaller and faster to download\n"
+               "  • Use 'Analyze' button for detailed format information\n")
 
     def _on_url_focus_in(self, event):
         """Clear URL entry when it gains focus and check clipboard"""
-        if self.url_entry.get() == "Enter a YouTube URL":
+        if self.url_entry.get() == self._PLACEHOLDER:
             self.url_entry.delete(0, tk.END)
         
         # Check clipboard for YouTube URL when focusing
@@ -1303,117 +1808,181 @@ class YouTubeDownloaderGUI:
     def _on_url_focus_out(self, event):
         """Restore default text if URL entry is empty"""
         if not self.url_entry.get():
-            self.url_entry.insert(0, "Enter a YouTube URL")
+            self.url_entry.insert(0, self._PLACEHOLDER)
     
     def _is_youtube_url(self, url):
         """Check if the given URL is a valid YouTube URL"""
-        if not url:
+        # Anything shorter than a video id or longer than a plausible URL
+        # (with query params) can be rejected on length alone
+        if not url or len(url) < 11 or len(url) > 256:
             return False
-        
-        # Convert to lowercase for easier matching
-        url_lower = url.lower().strip()
-        
-        # Check for various YouTube URL patterns
-        youtube_patterns = [
-            'youtube.com',
-            'youtu.be',
-            'm.youtube.com',
-            'www.youtube.com'
-        ]
-        
-        return any(pattern in url_lower for pattern in youtube_patterns)
+
+        url = url.strip()
+
+        # Reject non-YouTube content with plain string compares before the
+        # regex engine ever runs; the regex then only validates URL shape
+        if not url.lower().startswith(_YT_PREFIXES):
+            return False
+
+        return _YT_URL_RE.match(url) is not None
     
+    def _get_clipboard(self):
+        """Read clipboard text over Tk's own display connection.
+
+        clipboard_get() is a single request on the socket Tk already holds,
+        unlike pyperclip which forks a helper process per read on
+        Linux/macOS, so it is cheap enough to call on the event loop.
+        """
+        try:
+            return self.root.clipboard_get()
+        except tk.TclError:
+            # Clipboard is empty or holds non-text data
+            return ""
+
+    def _try_apply_clipboard(self, clip, notify=False):
+        """Paste a YouTube URL from the clipboard into an empty URL field.
+
+        Shared by the focus, click, Ctrl+V and clipboard-change handlers;
+        reads the entry value once and returns True when the URL was pasted.
+        """
+        if not clip or not self._is_youtube_url(clip):
+            return False
+
+        # Never clobber a URL the user already typed; only fill an empty
+        # field or replace the placeholder
+        current_url = self.url_entry.get()
+        if current_url == clip or current_url not in ("", self._PLACEHOLDER):
+            return False
+
+        self.url_entry.delete(0, tk.END)
+        self.url_entry.insert(0, clip)
+
+        if notify:
+            self._show_clipboard_notification(f"Pasted from clipboard: {clip[:50]}...")
+        return True
+
     def _check_clipboard_on_focus(self):
         """Check clipboard when URL field gains focus"""
-        try:
-            clipboard_url = pyperclip.paste()
-            if clipboard_url and self._is_youtube_url(clipboard_url):
-                # Only paste if it's different from what's already there
-                current_url = self.url_entry.get()
-                if current_url != clipboard_url and current_url != "Enter a YouTube URL":
-                    self.url_entry.delete(0, tk.END)
-                    self.url_entry.insert(0, clipboard_url)
-                    
-                    # Show notification
-                    self._show_clipboard_notification(f"Pasted from clipboard: {clipboard_url[:50]}...")
-        except Exception as e:
-            # Silently handle clipboard errors
-            pass
-    
+        self._try_apply_clipboard(self._get_clipboard(), notify=True)
+
     def _check_clipboard_on_click(self, event):
         """Check if clipboard contains a YouTube URL and paste it"""
-        clipboard_url = pyperclip.paste()
-        if clipboard_url and self._is_youtube_url(clipboard_url):
-            # Only paste if it's different from what's already there
-            current_url = self.url_entry.get()
-            if current_url != clipboard_url and current_url != "Enter a YouTube URL":
+        self._apply_clipboard_on_click(self._get_clipboard())
+
+    def _apply_clipboard_on_click(self, clipboard_url):
+        """Apply a clipboard read triggered by clicking the URL field"""
+        if not self._try_apply_clipboard(clipboard_url):
+            if self.url_entry.get() == self._PLACEHOLDER:
                 self.url_entry.delete(0, tk.END)
-                self.url_entry.insert(0, clipboard_url)
-        elif self.url_entry.get() == "Enter a YouTube URL":
-            self.url_entry.delete(0, tk.END)
-    
-    def _manual_paste_from_clipboard(self, event):
-        """Handle manual Ctrl+V paste from clipboard"""
-        try:
-            clipboard_url = pyperclip.paste()
-            if clipboard_url and self._is_youtube_url(clipboard_url):
-                # Only paste if it's different from what's already there
-                current_url = self.url_entry.get()
-                if current_url != clipboard_url and current_url != "Enter a YouTube URL":
-                    self.url_entry.delete(0, tk.END)
-                    self.url_entry.insert(0, clipboard_url)
-                    
-                    # Show notification
-                    self._show_clipboard_notification(f"Pasted from clipboard: {clipboard_url[:50]}...")
-        except Exception as e:
-            # Silently handle clipboard errors
-            pass
-    
+
+    def _after_paste_validate(self, event):
+        """Validate the URL field after Tk's built-in paste has run"""
+        # after_idle so the default <<Paste>> binding has inserted the text
+        self.url_entry.after_idle(self._validate_pasted_url)
+
+    def _validate_pasted_url(self):
+        """Show a notification when a pasted value is a YouTube URL"""
+        url = self.url_entry.get()
+        if url and url != self._PLACEHOLDER and self._is_youtube_url(url):
+            self._show_clipboard_notification(f"Pasted from clipboard: {url[:50]}...")
+
+
     def _start_clipboard_monitoring(self):
         """Start monitoring clipboard for YouTube URLs"""
-        self._check_clipboard_periodically()
-    
+        # Prefer OS change notifications (zero wakeups while idle); keep the
+        # periodic poll only when no native backend is available
+        self._clipboard_watcher = ClipboardWatcher(self.root, self._on_clipboard_changed)
+        if not self._clipboard_watcher.start():
+            # User activity resets the adaptive backoff to the fast interval
+            for event in ('<FocusIn>', '<Button-1>', '<Key>'):
+                self.root.bind(event, self._reset_poll_interval, add='+')
+            self._check_clipboard_periodically()
+
+    def _reset_poll_interval(self, event=None):
+        """Return to the fast clipboard poll interval on user activity"""
+        self._poll_interval = 500
+
+    def _on_clipboard_changed(self):
+        """Handle a clipboard change (native event or fallback poll)"""
+        self._handle_clipboard_change(self._get_clipboard())
+
+    def _handle_clipboard_change(self, current_clipboard):
+        """Auto-paste newly copied YouTube URLs into an empty URL field"""
+        # Length gate before even fingerprinting: huge clipboard blobs
+        # (copied documents, code) can never be a YouTube URL
+        if not current_clipboard or len(current_clipboard) > 256:
+            return
+
+        # Compare small fingerprints instead of retaining the full
+        # clipboard string; skip unchanged content before any URL check
+        fingerprint = _clipboard_fingerprint(current_clipboard)
+        if fingerprint == self.last_clipboard_fingerprint:
+            return
+        self.last_clipboard_fingerprint = fingerprint
+
+        # Check if the new clipboard content is a YouTube URL
+        if self._is_youtube_url(current_clipboard):
+            # New URL seen: return the fallback poll to its fast interval
+            self._poll_interval = 500
+
+            # Auto-paste if URL field is empty or has placeholder
+            self._try_apply_clipboard(current_clipboard, notify=True)
+
     def _check_clipboard_periodically(self):
-        """Check clipboard every 2 seconds for new YouTube URLs"""
+        """Poll the clipboard for new YouTube URLs (fallback path)"""
+        # Skip the (potentially slow) clipboard read while minimised
         try:
-            current_clipboard = pyperclip.paste()
-            
-            # Check if clipboard contains a new YouTube URL
-            if (current_clipboard and 
-                self._is_youtube_url(current_clipboard) and 
-                current_clipboard != self.last_clipboard_content):
-                
-                # Update last clipboard content
-                self.last_clipboard_content = current_clipboard
-                
-                # Auto-paste if URL field is empty or has placeholder
-                current_url = self.url_entry.get()
-                if current_url == "" or current_url == "Enter a YouTube URL":
-                    self.url_entry.delete(0, tk.END)
-                    self.url_entry.insert(0, current_clipboard)
-                    
-                    # Show a subtle notification
-                    self._show_clipboard_notification(f"Auto-pasted: {current_clipboard[:50]}...")
-            
-        except Exception as e:
-            # Silently handle clipboard errors
-            pass
-        
-        # Schedule next check in 2 seconds
-        self.root.after(2000, self._check_clipboard_periodically)
+            iconic = self.root.state() == 'iconic'
+        except tk.TclError:
+            iconic = False
+
+        if not iconic:
+            # Back off now; the change handler resets the interval when the
+            # read actually finds new content
+            self._poll_interval = min(self._poll_interval * 2, 8000)
+            self._on_clipboard_changed()
+
+        # Schedule the next check at the adaptive interval, keeping the id
+        # so the callback can be cancelled on window close
+        self._poll_after_id = self.root.after(self._poll_interval,
+                                              self._check_clipboard_periodically)
+
+    def _on_close(self):
+        """Cancel periodic work before the window is destroyed"""
+        if self._poll_after_id:
+            self.root.after_cancel(self._poll_after_id)
+            self._poll_after_id = None
+        if self._notif_after:
+            self.root.after_cancel(self._notif_after)
+            self._notif_after = None
+        if self._refresh_after_id:
+            self.root.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+        if self._pump_after_id:
+            self.root.after_cancel(self._pump_after_id)
+            self._pump_after_id = None
+        self._clipboard_watcher.stop()
+        # Workers check this before scheduling results; the daemon threads
+        # themselves die with the process
+        self._closing = True
+        self.root.destroy()
     
     def _show_clipboard_notification(self, message):
         """Show a subtle notification about clipboard auto-paste"""
-        # Create a temporary notification label
-        notification = tk.Label(self.root, text=message, 
-                               bg=self.colors['accent'], fg=self.colors['text'],
-                               font=('Segoe UI', 9), padx=10, pady=5)
-        
+        self._notif.config(text=message)
+
         # Position it near the URL field
-        notification.place(relx=0.5, rely=0.3, anchor=tk.CENTER)
-        
-        # Remove after 3 seconds
-        self.root.after(3000, notification.destroy)
+        self._notif.place(relx=0.5, rely=0.3, anchor=tk.CENTER)
+
+        # Hide after 3 seconds; restart the timer when notifications overlap
+        if self._notif_after:
+            self.root.after_cancel(self._notif_after)
+        self._notif_after = self.root.after(3000, self._hide_clipboard_notification)
+
+    def _hide_clipboard_notification(self):
+        """Hide the shared notification label"""
+        self._notif_after = None
+        self._notif.place_forget()
 
 def main():
     root = tk.Tk()
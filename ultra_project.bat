@@ -85,7 +85,6 @@ if exist "requirements.txt" (
     echo [ERROR] requirements.txt not found!
     echo Creating basic requirements.txt...
     echo yt-dlp>=2023.12.30 > requirements.txt
-    echo pyperclip>=1.8.2 >> requirements.txt
     echo.
     echo [OK] Created requirements.txt
     echo Installing dependencies...
@@ -198,18 +197,16 @@ echo Available debug options:
 echo [1] Test frontend import
 echo [2] Test backend import
 echo [3] Check yt-dlp installation
-echo [4] Check pyperclip installation
-echo [5] Test FFmpeg
-echo [6] Return to main menu
+echo [4] Test FFmpeg
+echo [5] Return to main menu
 echo.
-set /p debug_choice="Enter debug choice (1-6): "
+set /p debug_choice="Enter debug choice (1-5): "
 
 if "%debug_choice%"=="1" goto test_frontend
 if "%debug_choice%"=="2" goto test_backend
 if "%debug_choice%"=="3" goto test_ytdlp
-if "%debug_choice%"=="4" goto test_pyperclip
-if "%debug_choice%"=="5" goto test_ffmpeg
-if "%debug_choice%"=="6" goto main_menu
+if "%debug_choice%"=="4" goto test_ffmpeg
+if "%debug_choice%"=="5" goto main_menu
 goto debug_mode
 
 :test_frontend
@@ -247,17 +244,6 @@ if %errorlevel% neq 0 (
 pause
 goto debug_mode
 
-:test_pyperclip
-echo.
-echo Testing pyperclip installation...
-%PYTHON_PATH% -c "import pyperclip; print('[OK] pyperclip version:', pyperclip.__version__)" 2>nul
-if %errorlevel% neq 0 (
-    echo [ERROR] pyperclip not installed
-    echo Install with: %PYTHON_PATH% -m pip install pyperclip
-)
-pause
-goto debug_mode
-
 :test_ffmpeg
 echo.
 echo Testing FFmpeg installation...
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+YouTube Video and Audio Downloader - Launcher
+Single-shot dispatcher for the GUI and CLI modes
+"""
+
+import argparse
+
+
+def main(argv=None):
+    """Parse the mode once and launch it.
+
+    frontend and backend are imported inside the branches on purpose:
+    CLI users skip the tkinter import entirely, and the GUI path defers
+    backend (and with it yt-dlp) to its own lazy loader.
+    """
+    parser = argparse.ArgumentParser(
+        description="YouTube Video and Audio Downloader")
+    parser.add_argument('--mode', choices=['gui', 'cli'], default='gui',
+                        help="launch the graphical interface (default) or "
+                             "the interactive command-line downloader")
+    args = parser.parse_args(argv)
+
+    if args.mode == 'cli':
+        import threading
+        from backend import check_dependencies, run_cli
+
+        # Verify (and if needed install) yt-dlp in the background so the
+        # menu appears immediately instead of waiting on pip subprocesses;
+        # the first download happens well after the check finishes
+        threading.Thread(target=check_dependencies, daemon=True).start()
+        run_cli()
+    else:
+        from frontend import main as run_gui
+        run_gui()
+
+
+if __name__ == "__main__":
+    main()